@@ -125,7 +125,10 @@ def create_app(
                 _compat.migrate_pipeline(ppl_def)
                 job.pipeline_definition = ppl_def
                 attributes.flag_modified(job, "pipeline_definition")
-                db.session.commit()
+            # A single commit for all jobs, committing every job would
+            # release the row locks and expire the remaining instances,
+            # causing them to be reloaded one by one.
+            db.session.commit()
 
     with app.app_context():
         # Keep analytics subscribed to all events of interest.
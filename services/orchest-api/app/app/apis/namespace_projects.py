@@ -31,8 +31,10 @@ class ProjectList(Resource):
     def get(self):
         """Get all projects."""
 
-        projects = models.Project.query.all()
-        return {"projects": [proj.__dict__ for proj in projects]}, 200
+        # Only fetch the columns that are part of the response,
+        # env_variables is deferred and not returned by this endpoint.
+        projects = models.Project.query.with_entities(models.Project.uuid).all()
+        return {"projects": [{"uuid": proj.uuid} for proj in projects]}, 200
 
     @api.doc("create_project")
     @api.expect(schema.project)
@@ -167,13 +169,22 @@ class DeleteProject(TwoPhaseFunction):
         interactive_runs = (
             models.InteractivePipelineRun.query.filter_by(project_uuid=project_uuid)
             .filter(models.InteractivePipelineRun.status.in_(["PENDING", "STARTED"]))
+            .with_entities(models.InteractivePipelineRun.uuid)
             .all()
         )
-        for run in interactive_runs:
-            AbortPipelineRun(self.tpe).transaction(run.uuid)
-            # Will delete cascade interactive run pipeline step,
-            # interactive run image mapping.
-            db.session.delete(run)
+        run_uuids = [run.uuid for run in interactive_runs]
+        for run_uuid in run_uuids:
+            AbortPipelineRun(self.tpe).transaction(run_uuid)
+
+        # Delete the runs in bulk instead of one at a time. Will delete
+        # cascade interactive run pipeline steps, interactive run image
+        # mappings at the db level.
+        batch_size = 500
+        for i in range(0, len(run_uuids), batch_size):
+            batch_uuids = run_uuids[i : i + batch_size]
+            models.InteractivePipelineRun.query.filter(
+                models.InteractivePipelineRun.uuid.in_(batch_uuids)
+            ).delete(synchronize_session=False)
 
         # Stop (and delete) any interactive session related to the
         # project.
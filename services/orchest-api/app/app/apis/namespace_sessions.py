@@ -466,12 +466,13 @@ class LaunchKernel(TwoPhaseFunction):
                 "spark_context_init_mode"
             ]
 
+        # Project and pipeline env variables may override the ones
+        # above, hence the dict.
         environment.update(
             utils.get_proj_pip_env_variables(project_uuid, pipeline_uuid)
         )
         # No "PATH" changes, could break code execution.
-        environment.pop("PATH", None)
-        env = [{"name": k, "value": v} for k, v in environment.items()]
+        env = [{"name": k, "value": v} for k, v in environment.items() if k != "PATH"]
 
         pod_manifest = {
             "apiVersion": "v1",
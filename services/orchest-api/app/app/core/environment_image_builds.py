@@ -1,5 +1,6 @@
 import json
 import os
+import shutil
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Optional
@@ -298,12 +299,9 @@ def prepare_build_context(task_uuid, project_uuid, environment_uuid, project_pat
     )
     snapshot_setup_script_path = os.path.join(snapshot_path, bash_script_name)
     # Move the startup script to the context.
-    os.system(
-        'cp "%s" "%s"'
-        % (
-            os.path.join(environment_path, _config.ENV_SETUP_SCRIPT_FILE_NAME),
-            snapshot_setup_script_path,
-        )
+    shutil.copyfile(
+        os.path.join(environment_path, _config.ENV_SETUP_SCRIPT_FILE_NAME),
+        snapshot_setup_script_path,
     )
 
     dockerfile_name = (
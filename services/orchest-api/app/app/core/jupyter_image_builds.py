@@ -1,5 +1,7 @@
 import os
+import shutil
 from datetime import datetime
+from pathlib import Path
 from typing import Any, Optional
 
 import requests
@@ -43,6 +45,63 @@ def update_jupyter_image_build_status(
         return response.json()
 
 
+_SSH_OPTIONS = (
+    'ssh -o "StrictHostKeyChecking=no" '
+    '-o "ServerAliveInterval=30" '
+    '-o "ServerAliveCountMax=30" '
+    '-o "UserKnownHostsFile=/dev/null" '
+)
+
+# Note: commands are concatenated with && because this way an
+# exit_code != 0 will bubble up and cause the build to fail, as it
+# should. The bash script is removed so that the user won't be able to
+# see it after the build is done.
+_JUPYTER_DOCKERFILE_RUN_STATEMENT = (
+    # To make user settings available to extensions that require it.
+    "RUN mkdir /root/.jupyter/lab -p "
+    "&& rm /root/.jupyter/lab/user-settings -rf "
+    "&& mv _orchest_configurations_jupyterlab_user_settings "
+    "/root/.jupyter/lab/user-settings "
+    # Run the user script.
+    "&& bash < {bash_script} "
+    # Other internal commands.
+    "&& build_path_ext=/jupyterlab-orchest-build/extensions "
+    "&& userdir_path_ext=/usr/local/share/jupyter/lab/extensions "
+    "&& if [ -d $userdir_path_ext ] && [ -d $build_path_ext ]; then "
+    "cp -rfT $userdir_path_ext $build_path_ext &> /dev/null ; fi "
+    "&& echo {flag} "
+    "&& rm {bash_script} "
+    # This is needed to rsync settings to the userdir since buildkit
+    # does not support writing to "bind" volumes.
+    "&& sshpass -p 'root' rsync -v -e '{ssh_options}' "
+    "-rlP /root/.jupyter/lab/user-settings/ "
+    "root@$BUILDER_POD_IP:/jupyterlab-user-settings/"
+    # The || <error flag> allows to avoid builder errors logs making
+    # into it the user logs and tell us that there has been an error.
+    "|| (echo {error_flag} && PRODUCE_AN_ERROR)"
+)
+
+# Only the arguments passed to format change from build to build, the
+# statements are joined once. Literal braces, e.g. shell ${VAR}, must be
+# escaped as ${{VAR}}.
+_JUPYTER_DOCKERFILE_TEMPLATE = "\n".join(
+    [
+        "FROM {base_image}",
+        "ARG BUILDER_POD_IP",
+        "ENV BUILDER_POD_IP=${{BUILDER_POD_IP}}",
+        "WORKDIR {work_dir}",
+        "COPY . .",
+        _JUPYTER_DOCKERFILE_RUN_STATEMENT,
+        # Set the WORKDIR back to project-dir, so that terminals created
+        # through jupyter server have said WORKDIR, and extensions can
+        # rely on the process WORKDIR being the project directory.
+        "WORKDIR /project-dir",
+        # Make it so that the digest of the produced image is unique.
+        "RUN mkdir -p /orchest && echo '{task_uuid}' > /orchest/task_{task_uuid}.txt",
+    ]
+)
+
+
 def write_jupyter_dockerfile(base_image, task_uuid, work_dir, bash_script, path):
     """Write a custom dockerfile with the given specifications.
 
@@ -66,81 +125,24 @@ def write_jupyter_dockerfile(base_image, task_uuid, work_dir, bash_script, path)
         bash_script: Script to run in a RUN command.
         path: Where to save the file.
 
-    Returns:
-        Dictionary containing build context details.
-
     """
-    statements = []
-
     custom_registry_prefix = "registry:"
     if base_image.startswith(custom_registry_prefix):
         full_basename = base_image[len(custom_registry_prefix) :]
     else:
         full_basename = f"docker.io/{base_image}"
 
-    statements.append(f"FROM {full_basename}")
-    statements.append("ARG BUILDER_POD_IP")
-    statements.append("ENV BUILDER_POD_IP=${BUILDER_POD_IP}")
-    statements.append(f'WORKDIR {os.path.join("/", work_dir)}')
-
-    statements.append("COPY . .")
-
-    # Note: commands are concatenated with && because this way an
-    # exit_code != 0 will bubble up and cause the build to fail, as it
-    # should. The bash script is removed so that the user won't be able
-    # to see it after the build is done.
-    flag = CONFIG_CLASS.BUILD_IMAGE_LOG_FLAG
-    error_flag = CONFIG_CLASS.BUILD_IMAGE_ERROR_FLAG
-
-    ssh_options = (
-        'ssh -o "StrictHostKeyChecking=no" '
-        '-o "ServerAliveInterval=30" '
-        '-o "ServerAliveCountMax=30" '
-        '-o "UserKnownHostsFile=/dev/null" '
-    )
-    # This is needed to rsync settings to the userdir since buildkit
-    # does not support writing to "bind" volumes.
-    rsync_jupyter_settings_command = (
-        f"sshpass -p 'root' rsync -v -e '{ssh_options}' "
-        f"-rlP /root/.jupyter/lab/user-settings/ "
-        f"root@$BUILDER_POD_IP:/jupyterlab-user-settings/"
-    )
-
-    statements.append(
-        # To make user settings available to extensions that require it.
-        "RUN mkdir /root/.jupyter/lab -p "
-        "&& rm /root/.jupyter/lab/user-settings -rf "
-        "&& mv _orchest_configurations_jupyterlab_user_settings "
-        "/root/.jupyter/lab/user-settings "
-        # Run the user script.
-        f"&& bash < {bash_script} "
-        # Other internal commands.
-        "&& build_path_ext=/jupyterlab-orchest-build/extensions "
-        "&& userdir_path_ext=/usr/local/share/jupyter/lab/extensions "
-        "&& if [ -d $userdir_path_ext ] && [ -d $build_path_ext ]; then "
-        "cp -rfT $userdir_path_ext $build_path_ext &> /dev/null ; fi "
-        f"&& echo {flag} "
-        f"&& rm {bash_script} "
-        f"&& {rsync_jupyter_settings_command}"
-        # The || <error flag> allows to avoid builder errors logs making
-        # into it the user logs and tell us that there has been an
-        # error.
-        f"|| (echo {error_flag} && PRODUCE_AN_ERROR)"
-    )
-
-    # Set the WORKDIR back to project-dir, so that terminals created
-    # through jupyter server have said WORKDIR, and extensions can rely
-    # on the process WORKDIR being the project directory.
-    statements.append("WORKDIR /project-dir")
-
-    # Make it so that the digest of the produced image is unique.
-    statements.append(
-        f"RUN mkdir -p /orchest && echo '{task_uuid}' > /orchest/task_{task_uuid}.txt"
+    Path(path).write_text(
+        _JUPYTER_DOCKERFILE_TEMPLATE.format(
+            base_image=full_basename,
+            work_dir=os.path.join("/", work_dir),
+            bash_script=bash_script,
+            task_uuid=task_uuid,
+            flag=CONFIG_CLASS.BUILD_IMAGE_LOG_FLAG,
+            error_flag=CONFIG_CLASS.BUILD_IMAGE_ERROR_FLAG,
+            ssh_options=_SSH_OPTIONS,
+        )
     )
-    statements = "\n".join(statements)
-
-    with open(path, "w") as dockerfile:
-        dockerfile.write(statements)
 
 
 def prepare_build_context(task_uuid):
@@ -164,7 +166,7 @@ def prepare_build_context(task_uuid):
     if os.path.isdir(snapshot_path):
         rmtree(snapshot_path)
 
-    os.system('mkdir "%s"' % (snapshot_path))
+    Path(snapshot_path).mkdir(parents=True, exist_ok=True)
 
     dockerfile_name = ".orchest-reserved-jupyter-dockerfile"
     bash_script_name = ".orchest-reserved-jupyter-setup.sh"
@@ -172,12 +174,10 @@ def prepare_build_context(task_uuid):
     snapshot_setup_script_path = os.path.join(snapshot_path, bash_script_name)
     if os.path.isfile(jupyterlab_setup_script):
         # Move the setup_script to the context.
-        os.system(
-            'cp "%s" "%s"' % (jupyterlab_setup_script, snapshot_setup_script_path)
-        )
+        shutil.copyfile(jupyterlab_setup_script, snapshot_setup_script_path)
     else:
         # Create empty shell script if no setup_script exists.
-        os.system(f'touch "{snapshot_setup_script_path}"')
+        Path(snapshot_setup_script_path).touch()
 
     base_image = f"orchest/jupyter-server:{CONFIG_CLASS.ORCHEST_VERSION}"
 
@@ -741,6 +741,9 @@ class PipelineRun(BaseModel):
             "status",
             "pipeline_uuid",
         ),
+        # To find the PENDING/STARTED runs of a project, e.g. on project
+        # deletion.
+        Index(None, "project_uuid", "status"),
     )
 
     project_uuid = db.Column(
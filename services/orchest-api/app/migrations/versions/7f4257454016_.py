@@ -0,0 +1,30 @@
+"""Add PipelineRun project_uuid, status index
+
+Revision ID: 7f4257454016
+Revises: 4d5dab2f4bda
+Create Date: 2026-10-15 20:05:12.318204
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "7f4257454016"
+down_revision = "4d5dab2f4bda"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        op.f("ix_pipeline_runs_project_uuid_pipeline_runs_status"),
+        "pipeline_runs",
+        ["project_uuid", "status"],
+        unique=False,
+    )
+
+
+def downgrade():
+    op.drop_index(
+        op.f("ix_pipeline_runs_project_uuid_pipeline_runs_status"),
+        table_name="pipeline_runs",
+    )
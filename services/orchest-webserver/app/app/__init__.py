@@ -40,6 +40,9 @@ from app.views.views import register_views
 @contextlib.contextmanager
 def create_app_managed():
 
+    # Defined upfront so that an exception raised by create_app is not
+    # masked by an UnboundLocalError in the finally clause.
+    processes = []
     try:
         (app, socketio, processes) = create_app()
         yield app, socketio
@@ -98,6 +101,7 @@ def create_app(to_migrate_db=False):
     # twice. Because before the app starts we first migrate.
     app.logger.info("Flask CONFIG: %s" % app.config)
 
+    to_populate_kernels = False
     if not _utils.is_running_from_reloader():
         with app.app_context():
             try:
@@ -123,16 +127,9 @@ def create_app(to_migrate_db=False):
 
                 # On startup all kernels are refreshed. This is because
                 # updating Orchest might make the kernels in the
-                # userdir/.orchest/kernels directory invalid.
-                projs = Project.query.all()
-                for proj in projs:
-                    try:
-                        populate_kernels(app, db, proj.uuid)
-                    except Exception as e:
-                        logging.error(
-                            "Failed to populate kernels on startup"
-                            " for project %s: %s [%s]" % (proj.uuid, e, type(e))
-                        )
+                # userdir/.orchest/kernels directory invalid. This is
+                # done by the scheduler to not delay serving requests.
+                to_populate_kernels = True
 
     # create thread for non-cpu bound background tasks, e.g. requests
     scheduler = BackgroundScheduler(
@@ -150,6 +147,8 @@ def create_app(to_migrate_db=False):
     )
     app.config["SCHEDULER"] = scheduler
     add_recurring_jobs_to_scheduler(scheduler, app, run_on_add=True)
+    if to_populate_kernels:
+        scheduler.add_job(populate_all_kernels, args=[app])
     scheduler.start()
 
     # static file serving
@@ -172,6 +171,19 @@ def create_app(to_migrate_db=False):
     return app, socketio, []
 
 
+def populate_all_kernels(app):
+    with app.app_context():
+        projs = Project.query.all()
+        for proj in projs:
+            try:
+                populate_kernels(app, db, proj.uuid)
+            except Exception as e:
+                logging.error(
+                    "Failed to populate kernels on startup"
+                    " for project %s: %s [%s]" % (proj.uuid, e, type(e))
+                )
+
+
 def init_logging():
     dictConfig(config.CONFIG_CLASS.LOGGING_CONFIG)
 
@@ -9,6 +9,16 @@ class Config:
 
     SQLALCHEMY_DATABASE_URI = "postgresql://postgres@orchest-database/orchest_webserver"
     SQLALCHEMY_TRACK_MODIFICATIONS = False
+    # The webserver serves requests through many gthread threads, size
+    # the pool accordingly and make sure that connections closed by the
+    # database while idle are not handed out.
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        "pool_size": 10,
+        "max_overflow": 20,
+        "pool_timeout": 30,
+        "pool_recycle": 1800,
+        "pool_pre_ping": True,
+    }
 
     dir_path = os.path.dirname(os.path.realpath(__file__))
 
@@ -53,9 +53,10 @@ def add_recurring_jobs_to_scheduler(
         scheduler: Scheduler to which the jobs will be added.
         app: Flask app to read config values from such as the interval
             that is used for the recurring jobs.
-        run_on_add: If True will try to run the jobs when added to the
-            scheduler (it will still only run if the interval has
-            passed).
+        run_on_add: If True will try to run the jobs as soon as the
+            scheduler is started (it will still only run if the
+            interval has passed). The initial run happens in the
+            scheduler thread so that it doesn't delay app startup.
 
     """
     jobs = Jobs()
@@ -80,24 +81,20 @@ def add_recurring_jobs_to_scheduler(
     for name, job in recurring_jobs.items():
         if job["allowed_to_run"]:
             app.logger.debug(f"Adding recurring job '{name}' to scheduler.")
+            job_kwargs = {}
+            if run_on_add:
+                # To prevent multiple gunicorn workers on app
+                # initialization to run the job, we still use the
+                # interval.
+                job_kwargs["next_run_time"] = datetime.datetime.now()
             scheduler.add_job(
                 job["job_func"],
                 "interval",
                 minutes=job["interval"],
                 args=[app, job["interval"]],
+                **job_kwargs,
             )
 
-            if run_on_add:
-                try:
-                    # To prevent multiple gunicorn workers on app
-                    # initialization to run the job, we still use the
-                    # interval.
-                    job["job_func"](app, job["interval"])
-                except Exception:
-                    app.logger.error(
-                        f"Failed to do initial run of recurring job: '{name}'."
-                    )
-
 
 class Jobs:
     def __init__(self):
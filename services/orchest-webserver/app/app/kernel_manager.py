@@ -1,4 +1,5 @@
 import os
+import threading
 from distutils.dir_util import copy_tree
 
 from _orchest.internals import config as _config
@@ -17,7 +18,25 @@ def cleanup_kernel(app, project_uuid):
         clear_folder(kernels_dir_path)
 
 
+# Kernels are populated both by the scheduler on startup and by request
+# handlers, which would otherwise interleave clearing and writing the
+# kernels directory of the same project.
+_project_locks = {}
+_project_locks_lock = threading.Lock()
+
+
+def _get_project_lock(project_uuid: str) -> threading.Lock:
+    with _project_locks_lock:
+        return _project_locks.setdefault(project_uuid, threading.Lock())
+
+
 def populate_kernels(app, db, project_uuid):
+    """Populates the kernels of the project, one call at a time."""
+    with _get_project_lock(project_uuid):
+        _populate_kernels(app, db, project_uuid)
+
+
+def _populate_kernels(app, db, project_uuid):
 
     # cleanup old kernels
     cleanup_kernel(app, project_uuid)
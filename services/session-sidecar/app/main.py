@@ -1,3 +1,4 @@
+import functools
 import json
 import logging
 import os
@@ -42,10 +43,7 @@ def get_services_to_follow() -> List[str]:
     return services_to_follow
 
 
-def follow_service_logs(service):
-    config.load_incluster_config()
-    k8s_core_api = client.CoreV1Api()
-
+def follow_service_logs(k8s_core_api: client.CoreV1Api, service: str):
     logging.info(f"Initiating logs file for service {service}.")
     with open(get_service_log_file_path(service), "w") as log_file:
         # Used by the log_streamer.py to infer that a new session
@@ -135,5 +133,10 @@ if __name__ == "__main__":
     logging.info(
         f"Following services: {services_to_follow} for {Config.SESSION_TYPE} session."
     )
+    # A single client is shared by all threads so that the config is
+    # only loaded once and connections to the k8s API are pooled.
+    config.load_incluster_config()
+    k8s_core_api = client.CoreV1Api()
+
     pool = ThreadPool(len(services_to_follow))
-    pool.map(follow_service_logs, services_to_follow)
+    pool.map(functools.partial(follow_service_logs, k8s_core_api), services_to_follow)